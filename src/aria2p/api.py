@@ -302,10 +302,20 @@ class API:
             for gid in gids:
                 downloads.append(Download(self, self.client.tell_status(gid)))
         else:
+            # fetch the active, waiting and stopped downloads in a single request
+            results = self.client.multicall2(
+                [
+                    (self.client.TELL_ACTIVE, []),
+                    (self.client.TELL_WAITING, [0, 1000]),
+                    (self.client.TELL_STOPPED, [0, 1000]),
+                ],
+            )
             structs = []
-            structs.extend(self.client.tell_active())
-            structs.extend(self.client.tell_waiting(0, 1000))
-            structs.extend(self.client.tell_stopped(0, 1000))
+            for result in results:
+                # each result is either a one-item list containing the return value, or an error struct
+                if isinstance(result, dict):
+                    raise Client.response_as_exception({"error": result})
+                structs.extend(result[0])
             downloads = [Download(self, struct) for struct in structs]
 
         return downloads
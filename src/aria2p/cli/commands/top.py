@@ -6,11 +6,6 @@ import sys
 
 from aria2p.api import API
 
-try:
-    from aria2p.interface import Interface
-except ImportError:
-    Interface = None  # type: ignore  # noqa: WPS440 (variable overlap)
-
 
 def top(api: API) -> int:
     """
@@ -22,7 +17,10 @@ def top(api: API) -> int:
     Returns:
         int: Always 0.
     """
-    if Interface is None:
+    # imported here so that other commands don't pay for loading the interface and its dependencies
+    try:
+        from aria2p.interface import Interface  # noqa: WPS433 (nested import)
+    except ImportError:
         print(
             "The top-interface dependencies are not installed. Try running `pip install aria2p[tui]` to install them.",
             file=sys.stderr,
@@ -16,10 +16,13 @@ from __future__ import annotations
 
 import os
 import sys
+import threading
 import time
-from collections import defaultdict
+from concurrent.futures import Future
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
-from typing import Dict, Sequence
+from typing import Any, Dict, Sequence
 
 import pyperclip
 import requests
@@ -34,25 +37,24 @@ from aria2p.utils import get_version, load_configuration
 configs = load_configuration()
 
 
-def key_bind_parser(action: str) -> list[Key]:
+def key_bind_parser(action: str) -> tuple[tuple[str, ...], tuple[int, ...]]:
     """
-    Return a list of Key instances.
+    Return the names and values of the keys bound to an action.
 
     Arguments:
         action: The action name.
 
     Returns:
-        A list of keys.
+        A tuple of key names and a tuple of key values.
     """
     default_bindings = configs["DEFAULT"]["key_bindings"]
     bindings = configs.get("USER", {}).get("key_bindings", default_bindings)
 
     key_binds = bindings.get(action, default_bindings[action])
 
-    if isinstance(key_binds, list):
-        return [Key(k) for k in key_binds]
-    else:
-        return [Key(key_binds)]
+    if not isinstance(key_binds, list):
+        key_binds = [key_binds]
+    return tuple(key_binds), tuple(get_key_value(name) for name in key_binds)
 
 
 def color_palette_parser(palette: str) -> tuple[int, int, int]:
@@ -97,108 +99,96 @@ def color_palette_parser(palette: str) -> tuple[int, int, int]:
     )
 
 
-class Key:
-    """A class to represent an input key."""
-
-    OTHER_KEY_VALUES = {
-        "F1": Screen.KEY_F1,
-        "F2": Screen.KEY_F2,
-        "F3": Screen.KEY_F3,
-        "F4": Screen.KEY_F4,
-        "F5": Screen.KEY_F5,
-        "F6": Screen.KEY_F6,
-        "F7": Screen.KEY_F7,
-        "F8": Screen.KEY_F8,
-        "F9": Screen.KEY_F9,
-        "F10": Screen.KEY_F10,
-        "F11": Screen.KEY_F11,
-        "F12": Screen.KEY_F12,
-        "ESC": Screen.KEY_ESCAPE,
-        "DEL": Screen.KEY_DELETE,
-        "PAGE_UP": Screen.KEY_PAGE_UP,
-        "PAGE_DOWN": Screen.KEY_PAGE_DOWN,
-        "HOME": Screen.KEY_HOME,
-        "END": Screen.KEY_END,
-        "LEFT": Screen.KEY_LEFT,
-        "UP": Screen.KEY_UP,
-        "RIGHT": Screen.KEY_RIGHT,
-        "DOWN": Screen.KEY_DOWN,
-        "BACK": Screen.KEY_BACK,
-        "TAB": Screen.KEY_TAB,
-        "SPACE": ord(" "),
-        "ENTER": ord("\n"),
-    }
-
-    def __init__(self, name: str, value: int | None = None) -> None:
-        """
-        Initialize the object.
-
-        Arguments:
-            name: The key name.
-            value: The key value.
-        """
-        self.name = name
-        if value is None:
-            value = self.get_value(name)
-        self.value = value
-
-    def get_value(self, name: str) -> int:
-        try:
-            value = ord(name)
-        except TypeError:
-            value = self.OTHER_KEY_VALUES[name.upper()]
+# used for the interface background and for any palette name missing from Interface.palettes
+DEFAULT_PALETTE = color_palette_parser("UI")
+
+OTHER_KEY_VALUES = {
+    "F1": Screen.KEY_F1,
+    "F2": Screen.KEY_F2,
+    "F3": Screen.KEY_F3,
+    "F4": Screen.KEY_F4,
+    "F5": Screen.KEY_F5,
+    "F6": Screen.KEY_F6,
+    "F7": Screen.KEY_F7,
+    "F8": Screen.KEY_F8,
+    "F9": Screen.KEY_F9,
+    "F10": Screen.KEY_F10,
+    "F11": Screen.KEY_F11,
+    "F12": Screen.KEY_F12,
+    "ESC": Screen.KEY_ESCAPE,
+    "DEL": Screen.KEY_DELETE,
+    "PAGE_UP": Screen.KEY_PAGE_UP,
+    "PAGE_DOWN": Screen.KEY_PAGE_DOWN,
+    "HOME": Screen.KEY_HOME,
+    "END": Screen.KEY_END,
+    "LEFT": Screen.KEY_LEFT,
+    "UP": Screen.KEY_UP,
+    "RIGHT": Screen.KEY_RIGHT,
+    "DOWN": Screen.KEY_DOWN,
+    "BACK": Screen.KEY_BACK,
+    "TAB": Screen.KEY_TAB,
+    "SPACE": ord(" "),
+    "ENTER": ord("\n"),
+}
+
+
+def get_key_value(name: str) -> int:
+    """
+    Return the key code of a key.
 
-        return value
+    Arguments:
+        name: The key name, either a single character or a special key name like "F1" or "esc".
 
-    def __eq__(self, value: object) -> bool:
-        return self.value == value
+    Returns:
+        The key code.
+    """
+    try:
+        return ord(name)
+    except TypeError:
+        return OTHER_KEY_VALUES[name.upper()]
 
 
 class Keys:
-    """The actions and their shortcuts keys."""
-
-    AUTOCLEAR = key_bind_parser("AUTOCLEAR")
-    CANCEL = key_bind_parser("CANCEL")
-    ENTER = key_bind_parser("ENTER")
-    FILTER = key_bind_parser("FILTER")
-    FOLLOW_ROW = key_bind_parser("FOLLOW_ROW")
-    HELP = key_bind_parser("HELP")
-    MOVE_DOWN = key_bind_parser("MOVE_DOWN")
-    MOVE_LEFT = key_bind_parser("MOVE_LEFT")
-    MOVE_RIGHT = key_bind_parser("MOVE_RIGHT")
-    MOVE_UP = key_bind_parser("MOVE_UP")
-    NEXT_SORT = key_bind_parser("NEXT_SORT")
-    PREVIOUS_SORT = key_bind_parser("PREVIOUS_SORT")
-    PRIORITY_DOWN = key_bind_parser("PRIORITY_DOWN")
-    PRIORITY_UP = key_bind_parser("PRIORITY_UP")
-    QUIT = key_bind_parser("QUIT")
-    REMOVE_ASK = key_bind_parser("REMOVE_ASK")
-    REVERSE_SORT = key_bind_parser("REVERSE_SORT")
-    SEARCH = key_bind_parser("SEARCH")
-    SELECT_SORT = key_bind_parser("SELECT_SORT")
-    SETUP = key_bind_parser("SETUP")
-    TOGGLE_EXPAND_COLLAPSE_ALL = key_bind_parser("TOGGLE_EXPAND_COLLAPSE_ALL")
-    TOGGLE_EXPAND_COLLAPSE = key_bind_parser("TOGGLE_EXPAND_COLLAPSE")
-    TOGGLE_RESUME_PAUSE = key_bind_parser("TOGGLE_RESUME_PAUSE")
-    TOGGLE_RESUME_PAUSE_ALL = key_bind_parser("TOGGLE_RESUME_PAUSE_ALL")
-    TOGGLE_SELECT = key_bind_parser("TOGGLE_SELECT")
-    UN_SELECT_ALL = key_bind_parser("UN_SELECT_ALL")
-    MOVE_HOME = key_bind_parser("MOVE_HOME")
-    MOVE_END = key_bind_parser("MOVE_END")
-    MOVE_UP_STEP = key_bind_parser("MOVE_UP_STEP")
-    MOVE_DOWN_STEP = key_bind_parser("MOVE_DOWN_STEP")
-    TOGGLE_RESUME_PAUSE_ALL = key_bind_parser("TOGGLE_RESUME_PAUSE_ALL")
-    RETRY = key_bind_parser("RETRY")
-    RETRY_ALL = key_bind_parser("RETRY_ALL")
-    ADD_DOWNLOADS = key_bind_parser("ADD_DOWNLOADS")
+    """
+    The actions and their shortcuts keys.
 
-    @staticmethod
-    def names(keys_list):
-        return [key.name for key in keys_list]
+    Each action has a tuple of key names, displayed in the help screen,
+    and a parallel tuple of key values, used to dispatch keyboard events.
+    """
 
-    @staticmethod
-    def values(keys_list):
-        return [key.value for key in keys_list]
+    AUTOCLEAR_NAMES, AUTOCLEAR_VALUES = key_bind_parser("AUTOCLEAR")
+    CANCEL_NAMES, CANCEL_VALUES = key_bind_parser("CANCEL")
+    ENTER_NAMES, ENTER_VALUES = key_bind_parser("ENTER")
+    FILTER_NAMES, FILTER_VALUES = key_bind_parser("FILTER")
+    FOLLOW_ROW_NAMES, FOLLOW_ROW_VALUES = key_bind_parser("FOLLOW_ROW")
+    HELP_NAMES, HELP_VALUES = key_bind_parser("HELP")
+    MOVE_DOWN_NAMES, MOVE_DOWN_VALUES = key_bind_parser("MOVE_DOWN")
+    MOVE_LEFT_NAMES, MOVE_LEFT_VALUES = key_bind_parser("MOVE_LEFT")
+    MOVE_RIGHT_NAMES, MOVE_RIGHT_VALUES = key_bind_parser("MOVE_RIGHT")
+    MOVE_UP_NAMES, MOVE_UP_VALUES = key_bind_parser("MOVE_UP")
+    NEXT_SORT_NAMES, NEXT_SORT_VALUES = key_bind_parser("NEXT_SORT")
+    PREVIOUS_SORT_NAMES, PREVIOUS_SORT_VALUES = key_bind_parser("PREVIOUS_SORT")
+    PRIORITY_DOWN_NAMES, PRIORITY_DOWN_VALUES = key_bind_parser("PRIORITY_DOWN")
+    PRIORITY_UP_NAMES, PRIORITY_UP_VALUES = key_bind_parser("PRIORITY_UP")
+    QUIT_NAMES, QUIT_VALUES = key_bind_parser("QUIT")
+    REMOVE_ASK_NAMES, REMOVE_ASK_VALUES = key_bind_parser("REMOVE_ASK")
+    REVERSE_SORT_NAMES, REVERSE_SORT_VALUES = key_bind_parser("REVERSE_SORT")
+    SEARCH_NAMES, SEARCH_VALUES = key_bind_parser("SEARCH")
+    SELECT_SORT_NAMES, SELECT_SORT_VALUES = key_bind_parser("SELECT_SORT")
+    SETUP_NAMES, SETUP_VALUES = key_bind_parser("SETUP")
+    TOGGLE_EXPAND_COLLAPSE_ALL_NAMES, TOGGLE_EXPAND_COLLAPSE_ALL_VALUES = key_bind_parser("TOGGLE_EXPAND_COLLAPSE_ALL")
+    TOGGLE_EXPAND_COLLAPSE_NAMES, TOGGLE_EXPAND_COLLAPSE_VALUES = key_bind_parser("TOGGLE_EXPAND_COLLAPSE")
+    TOGGLE_RESUME_PAUSE_NAMES, TOGGLE_RESUME_PAUSE_VALUES = key_bind_parser("TOGGLE_RESUME_PAUSE")
+    TOGGLE_RESUME_PAUSE_ALL_NAMES, TOGGLE_RESUME_PAUSE_ALL_VALUES = key_bind_parser("TOGGLE_RESUME_PAUSE_ALL")
+    TOGGLE_SELECT_NAMES, TOGGLE_SELECT_VALUES = key_bind_parser("TOGGLE_SELECT")
+    UN_SELECT_ALL_NAMES, UN_SELECT_ALL_VALUES = key_bind_parser("UN_SELECT_ALL")
+    MOVE_HOME_NAMES, MOVE_HOME_VALUES = key_bind_parser("MOVE_HOME")
+    MOVE_END_NAMES, MOVE_END_VALUES = key_bind_parser("MOVE_END")
+    MOVE_UP_STEP_NAMES, MOVE_UP_STEP_VALUES = key_bind_parser("MOVE_UP_STEP")
+    MOVE_DOWN_STEP_NAMES, MOVE_DOWN_STEP_VALUES = key_bind_parser("MOVE_DOWN_STEP")
+    RETRY_NAMES, RETRY_VALUES = key_bind_parser("RETRY")
+    RETRY_ALL_NAMES, RETRY_ALL_VALUES = key_bind_parser("RETRY_ALL")
+    ADD_DOWNLOADS_NAMES, ADD_DOWNLOADS_VALUES = key_bind_parser("ADD_DOWNLOADS")
 
 
 class Exit(Exception):
@@ -214,6 +204,9 @@ class Column:
     and to get a color palette based on the text.
     """
 
+    # fast paths for the most common alignments, other paddings go through format()
+    alignments = {"<": str.ljust, ">": str.rjust}
+
     def __init__(self, header, padding, get_text, get_sort, get_palette):
         """
         Initialize the object.
@@ -227,6 +220,22 @@ class Column:
         """
         self.header = header
         self.padding = padding
+        # the last column fills the remaining width, which is only known when printing
+        self.fill = padding == "100%"
+        if self.fill:
+            self.pad, self.pad_width = str.ljust, 0
+            self.formatted_header = header
+        else:
+            align = self.alignments.get(padding[0])
+            if align is None:
+                # other alignments, like "^" or the numeric-only "=", keep format() semantics
+                self.pad = lambda text, width: format(text, padding)
+            else:
+                # cells are not always strings (integers, floats)
+                self.pad = lambda text, width: align(str(text), width)
+            self.pad_width = int(padding.lstrip("<>=^"))
+            # strings cannot be aligned with "=": such headers are right-aligned, like the numbers below them
+            self.formatted_header = format(header, padding.replace("=", ">")) + " "
         self.get_text = get_text
         self.get_sort = get_sort
         self.get_palette = get_palette
@@ -300,13 +309,19 @@ class Palette:
         return "status_" + value
 
     @staticmethod
+    @lru_cache(maxsize=2048)
     def name(value):
-        """Return the palette for a NAME cell."""
+        """
+        Return the palette for a NAME cell.
+
+        Results are cached since names rarely change between updates.
+        The returned lists are shared and must not be modified.
+        """
         if value.startswith("[METADATA]"):
             return (
                 [(Screen.COLOUR_GREEN, Screen.A_UNDERLINE, Screen.COLOUR_BLACK)] * 10
                 + [Interface.palettes["metadata"]] * (len(value.strip()) - 10)
-                + [Interface.palettes["row"]]
+                + [Interface.palettes.get("row", DEFAULT_PALETTE)]
             )
         return "name"
 
@@ -322,7 +337,9 @@ class Interface:
 
     - columns, columns_order and palettes attributes
     - sort and reverse attributes default values
-    - get_data method. It should return a list of objects that can be compared by equality (==, __eq__, __hash__)
+    - get_data method. It should return a list of objects with a unique and hashable `gid` attribute,
+      used to index them, to follow them across updates and to cache their rows
+    - get_row_key method, to return the values your columns depend on
     - __init__ method to accept other arguments
     - remove/change the few events with "download" or "self.api" in the process_event method
     """
@@ -336,9 +353,11 @@ class Interface:
         ADD_DOWNLOADS = 9
 
     state = State.MAIN
-    sleep = 0.005
-    frames = 200  # 200 * 0.005 seconds == 1 second
-    frame = 0
+    refresh_interval = 1  # seconds between two data updates
+    resize_check_interval = 0.1  # seconds, curses does not wake us up on resize
+    fetch_check_interval = 0.01  # seconds, while waiting for data fetched in the background
+    next_update = 0
+    fetching: Future | None = None
     focused = 0
     side_focused = 0
     sort = 2
@@ -352,83 +371,94 @@ class Interface:
     height = None
     screen = None
     data: list[Download] = []
-    rows: list[Sequence[str]] = []
+    sort_keys: list[Any] = []
+    data_index: dict[str, int] = {}
+    rows: list[Sequence[tuple[str, Any]] | None] = []
     scroller = None
     follow = None
     bounds: list[Sequence[int]] = []
-
-    palettes: Dict[str, tuple[int, int, int]] = defaultdict(lambda: color_palette_parser("UI"))
-    palettes.update(
-        {
-            "ui": color_palette_parser("UI"),
-            "header": color_palette_parser("HEADER"),
-            "focused_header": color_palette_parser("FOCUSED_HEADER"),
-            "focused_row": color_palette_parser("FOCUSED_ROW"),
-            "status_active": color_palette_parser("STATUS_ACTIVE"),
-            "status_paused": color_palette_parser("STATUS_PAUSED"),
-            "status_waiting": color_palette_parser("STATUS_WAITING"),
-            "status_error": color_palette_parser("STATUS_ERROR"),
-            "status_complete": color_palette_parser("STATUS_COMPLETE"),
-            "metadata": color_palette_parser("METADATA"),
-            "side_column_header": color_palette_parser("SIDE_COLUMN_HEADER"),
-            "side_column_row": color_palette_parser("SIDE_COLUMN_ROW"),
-            "side_column_focused_row": color_palette_parser("SIDE_COLUMN_FOCUSED_ROW"),
-            "bright_help": color_palette_parser("BRIGHT_HELP"),
-        }
-    )
+    column_at_x: list[int] = []
+    shadow: dict[int, tuple] = {}
+    shadow_layout = None
+    line_runs: dict[int, tuple] = {}
+    blanked: dict[tuple[int, int], int] = {}
+    rows_version = 0
+    row_cache: dict[str, tuple] = {}
+    last_paint_key = None
+
+    palettes: Dict[str, tuple[int, int, int]] = {
+        "ui": DEFAULT_PALETTE,
+        "header": color_palette_parser("HEADER"),
+        "focused_header": color_palette_parser("FOCUSED_HEADER"),
+        "focused_row": color_palette_parser("FOCUSED_ROW"),
+        "status_active": color_palette_parser("STATUS_ACTIVE"),
+        "status_paused": color_palette_parser("STATUS_PAUSED"),
+        "status_waiting": color_palette_parser("STATUS_WAITING"),
+        "status_error": color_palette_parser("STATUS_ERROR"),
+        "status_complete": color_palette_parser("STATUS_COMPLETE"),
+        "metadata": color_palette_parser("METADATA"),
+        "side_column_header": color_palette_parser("SIDE_COLUMN_HEADER"),
+        "side_column_row": color_palette_parser("SIDE_COLUMN_ROW"),
+        "side_column_focused_row": color_palette_parser("SIDE_COLUMN_FOCUSED_ROW"),
+        "bright_help": color_palette_parser("BRIGHT_HELP"),
+    }
 
     columns_order = ["gid", "status", "progress", "size", "down_speed", "up_speed", "eta", "name"]
     columns = {
         "gid": Column(
-            header="GID", padding=">16", get_text=lambda d: d.gid, get_sort=lambda d: d.gid, get_palette=lambda d: "gid"
+            header="GID",
+            padding=">16",
+            get_text=attrgetter("gid"),
+            get_sort=attrgetter("gid"),
+            get_palette=lambda d: "gid",
         ),
         "status": Column(
             header="STATUS",
             padding="<9",
-            get_text=lambda d: d.status,
-            get_sort=lambda d: d.status,
+            get_text=attrgetter("status"),
+            get_sort=attrgetter("status"),
             get_palette=Palette.status,
         ),
         "progress": Column(
             header="PROGRESS",
             padding=">8",
             get_text=lambda d: d.progress_string(),
-            get_sort=lambda d: d.progress,
+            get_sort=attrgetter("progress"),
             get_palette=lambda s: "progress",
         ),
         "size": Column(
             header="SIZE",
             padding=">11",
             get_text=lambda d: d.total_length_string(),
-            get_sort=lambda d: d.total_length,
+            get_sort=attrgetter("total_length"),
             get_palette=lambda s: "size",
         ),
         "down_speed": Column(
             header="DOWN_SPEED",
             padding=">13",
             get_text=lambda d: d.download_speed_string(),
-            get_sort=lambda d: d.download_speed,
+            get_sort=attrgetter("download_speed"),
             get_palette=lambda s: "down_speed",
         ),
         "up_speed": Column(
             header="UP_SPEED",
             padding=">13",
             get_text=lambda d: d.upload_speed_string(),
-            get_sort=lambda d: d.upload_speed,
+            get_sort=attrgetter("upload_speed"),
             get_palette=lambda s: "up_speed",
         ),
         "eta": Column(
             header="ETA",
             padding=">8",
             get_text=lambda d: d.eta_string(precision=2),
-            get_sort=lambda d: d.eta,
+            get_sort=attrgetter("eta"),
             get_palette=lambda s: "eta",
         ),
         "name": Column(
             header="NAME",
             padding="100%",
-            get_text=lambda d: d.name,
-            get_sort=lambda d: d.name,
+            get_text=attrgetter("name"),
+            get_sort=attrgetter("name"),
             get_palette=Palette.name,
         ),
     }
@@ -447,7 +477,7 @@ class Interface:
 
     downloads_uris: list[str] = []
     downloads_uris_header = (
-        f"Add Download: [ Hit ENTER to download; Hit { ','.join(Keys.names(Keys.ADD_DOWNLOADS)) } to download all ]"
+        f"Add Download: [ Hit ENTER to download; Hit { ','.join(Keys.ADD_DOWNLOADS_NAMES) } to download all ]"
     )
 
     def __init__(self, api=None):
@@ -464,6 +494,9 @@ class Interface:
         # reduce curses' 1 second delay when hitting escape to 25 ms
         os.environ.setdefault("ESCDELAY", "25")
 
+        # resolve the columns once, in display order
+        self.ordered_columns = [self.columns[column_name] for column_name in self.columns_order]
+
         self.state_mapping = {
             self.State.MAIN: {
                 "process_keyboard_event": self.process_keyboard_event_main,
@@ -497,15 +530,113 @@ class Interface:
             },
         }
 
+        # map key codes to their handler once, so each keyboard event is dispatched with a single dict lookup
+        self._main_dispatch = self.build_dispatch(
+            [
+                (Keys.MOVE_UP_VALUES, self._on_move_up),
+                (Keys.MOVE_DOWN_VALUES, self._on_move_down),
+                (Keys.MOVE_LEFT_VALUES, self._on_move_left),
+                (Keys.MOVE_RIGHT_VALUES, self._on_move_right),
+                (Keys.HELP_VALUES, self._on_help),
+                # not implemented: (Keys.SETUP_VALUES, ...),
+                (Keys.TOGGLE_RESUME_PAUSE_VALUES, self._on_toggle_resume_pause),
+                (Keys.PRIORITY_UP_VALUES, self._on_priority_up),
+                (Keys.PRIORITY_DOWN_VALUES, self._on_priority_down),
+                (Keys.REVERSE_SORT_VALUES, self._on_reverse_sort),
+                (Keys.NEXT_SORT_VALUES, self._on_next_sort),
+                (Keys.PREVIOUS_SORT_VALUES, self._on_previous_sort),
+                (Keys.SELECT_SORT_VALUES, self._on_select_sort),
+                (Keys.REMOVE_ASK_VALUES, self._on_remove_ask),
+                # not implemented: (Keys.TOGGLE_EXPAND_COLLAPSE_VALUES, ...),
+                # not implemented: (Keys.TOGGLE_EXPAND_COLLAPSE_ALL_VALUES, ...),
+                (Keys.AUTOCLEAR_VALUES, self._on_autoclear),
+                (Keys.FOLLOW_ROW_VALUES, self._on_follow_row),
+                # not implemented: (Keys.SEARCH_VALUES, ...),
+                # not implemented: (Keys.FILTER_VALUES, ...),
+                # not implemented: (Keys.TOGGLE_SELECT_VALUES, ...),
+                # not implemented: (Keys.UN_SELECT_ALL_VALUES, ...),
+                (Keys.MOVE_HOME_VALUES, self._on_move_home),
+                (Keys.MOVE_END_VALUES, self._on_move_end),
+                (Keys.MOVE_UP_STEP_VALUES, self._on_move_up_step),
+                (Keys.MOVE_DOWN_STEP_VALUES, self._on_move_down_step),
+                (Keys.TOGGLE_RESUME_PAUSE_ALL_VALUES, self._on_toggle_resume_pause_all),
+                (Keys.RETRY_VALUES, self._on_retry),
+                (Keys.RETRY_ALL_VALUES, self._on_retry_all),
+                (Keys.ADD_DOWNLOADS_VALUES, self._on_add_downloads),
+                (Keys.QUIT_VALUES, self._on_quit),
+            ]
+        )
+        self._remove_ask_dispatch = self.build_dispatch(
+            [
+                (Keys.CANCEL_VALUES, self._on_remove_ask_cancel),
+                (Keys.ENTER_VALUES, self._on_remove_ask_enter),
+                (Keys.MOVE_UP_VALUES, self._on_remove_ask_move_up),
+                (Keys.MOVE_DOWN_VALUES, self._on_remove_ask_move_down),
+            ]
+        )
+        self._select_sort_dispatch = self.build_dispatch(
+            [
+                (Keys.CANCEL_VALUES, self._on_select_sort_cancel),
+                (Keys.ENTER_VALUES, self._on_select_sort_enter),
+                (Keys.MOVE_UP_VALUES, self._on_select_sort_move_up),
+                (Keys.MOVE_DOWN_VALUES, self._on_select_sort_move_down),
+            ]
+        )
+        self._add_downloads_dispatch = self.build_dispatch(
+            [
+                (Keys.CANCEL_VALUES, self._on_add_downloads_cancel),
+                (Keys.MOVE_UP_VALUES, self._on_add_downloads_move_up),
+                (Keys.MOVE_DOWN_VALUES, self._on_add_downloads_move_down),
+                (Keys.ENTER_VALUES, self._on_add_downloads_enter),
+                (Keys.ADD_DOWNLOADS_VALUES, self._on_add_downloads_all),
+            ]
+        )
+
+        # key codes moving the focus in the main state, to coalesce them when keys are held
+        self._main_moves = {}
+        for key_code, handler in self._main_dispatch.items():
+            if handler == self._on_move_up:
+                self._main_moves[key_code] = -1
+            elif handler == self._on_move_down:
+                self._main_moves[key_code] = 1
+
+    @staticmethod
+    def build_dispatch(bindings):
+        """
+        Build a mapping of key codes to handlers.
+
+        When a key code is bound to several actions, the first one wins.
+
+        Arguments:
+            bindings (list): A list of (tuple of key values, handler) tuples.
+
+        Returns:
+            dict: A dictionary of key codes to handlers.
+        """
+        dispatch = {}
+        for key_values, handler in bindings:
+            for key_value in key_values:
+                dispatch.setdefault(key_value, handler)
+        return dispatch
+
     def run(self):
         """The main drawing loop."""
+        self.fetching = None
+        loaded = False
         try:
             # outer loop to support screen resize
             while True:
                 with ManagedScreen() as screen:
                     logger.debug(f"Created new screen {screen}")
                     self.set_screen(screen)
-                    self.frame = 0
+                    if not loaded:
+                        # the first data is loaded synchronously, so that the first events already act on it
+                        self.update_data()
+                        self.update_rows()
+                        self.next_update = time.monotonic() + self.refresh_interval
+                        loaded = True
+                    # a new screen is empty: print everything once
+                    repaint = True
                     # break (and re-enter) when screen has been resized
                     while not screen.has_resized():
                         # keep previous sort in memory to know if we have to re-sort the rows
@@ -513,16 +644,35 @@ class Interface:
                         previous_sort = (self.sort, self.reverse)
 
                         # we only refresh when explicitly asked for
-                        self.refresh = False
+                        self.refresh, repaint = repaint, False
+
+                        # block until an input arrives or it is time to update data,
+                        # waking up regularly to notice screen resizes and fetched data
+                        if self.fetching is None:
+                            timeout = min(self.next_update - time.monotonic(), self.resize_check_interval)
+                        else:
+                            timeout = self.fetch_check_interval
+                        if timeout > 0 and not self.refresh:
+                            screen.wait_for_input(timeout)
 
                         # process all events before refreshing screen,
                         # otherwise the reactivity is slowed down a lot with fast inputs
+                        pending_move = 0
                         event = screen.get_event()
-                        logger.debug(f"Got event {event}")
                         while event:
+                            logger.debug(f"Got event {event}")
                             # avoid crashing the interface if exceptions occur while processing an event
                             try:
-                                self.process_event(event)
+                                # coalesce bursts of vertical moves (held arrow keys) into a single move,
+                                # applied before any other event or change of direction to preserve ordering
+                                step = self._move_step(event)
+                                if pending_move and (not step or (step > 0) != (pending_move > 0)):
+                                    move, pending_move = pending_move, 0
+                                    self._apply_move(move)
+                                if step:
+                                    pending_move += step
+                                else:
+                                    self.process_event(event)
                             except Exit:
                                 logger.debug(f"Received exit command")
                                 return True
@@ -530,37 +680,75 @@ class Interface:
                                 # TODO: display error in status bar
                                 logger.exception(error)
                             event = screen.get_event()
-                            logger.debug(f"Got event {event}")
-
-                        # time to update data and rows
-                        if self.frame == 0:
-                            logger.debug(f"Tick! Updating data and rows")
+                        if pending_move:
+                            self._apply_move(pending_move)
+
+                        # time to fetch data, in the background
+                        if self.fetching is None and time.monotonic() >= self.next_update:
+                            logger.debug(f"Tick! Fetching data")
+                            self.fetching = self.fetch_data()
+                            self.next_update = time.monotonic() + self.refresh_interval
+
+                        # data was fetched: update data and rows
+                        updated = False
+                        if self.fetching is not None and self.fetching.done():
+                            logger.debug(f"Updating data and rows")
                             self.update_data()
                             self.update_rows()
-                            self.refresh = True
+                            self.refresh = updated = True
 
                         # time to refresh the screen
                         if self.refresh:
                             logger.debug(f"Refresh! Printing text")
-                            # sort if needed, unless it was just done at frame 0 when updating
-                            if (self.sort, self.reverse) != previous_sort and self.frame != 0:
-                                self.sort_data()
-                                self.update_rows()
-
-                            # actual printing and screen refresh
-                            for print_function in self.state_mapping[self.state]["print_functions"]:
-                                print_function()
-                            screen.refresh()
-
-                        # sleep and increment frame
-                        time.sleep(self.sleep)
-                        self.frame = (self.frame + 1) % self.frames
+                            # sort if needed, unless it was just done when updating
+                            if (self.sort, self.reverse) != previous_sort and not updated:
+                                if self.sort == previous_sort[0]:
+                                    self.reverse_data()
+                                else:
+                                    self.sort_data()
+                                    self.update_rows()
+
+                            # nothing to print if the visible state is the same as last time
+                            paint_key = self.get_paint_key()
+                            if paint_key != self.last_paint_key:
+                                self.last_paint_key = paint_key
+
+                                # cells remembered in the shadow buffer are only valid for the same layout:
+                                # other states draw over the table, and scrolling moves every cell
+                                layout = (self.state, self.x_scroll, self.x_offset)
+                                if layout != self.shadow_layout:
+                                    self.shadow.clear()
+                                    self.blanked.clear()
+                                    self.line_runs.clear()
+                                    self.shadow_layout = layout
+
+                                # actual printing and screen refresh
+                                for print_function in self.state_mapping[self.state]["print_functions"]:
+                                    print_function()
+                                screen.refresh()
                     logger.debug("Screen has resized")
                     self.post_resize()
         except Exception as error:
             logger.exception(error)
             return False
 
+    def get_paint_key(self):
+        """Return a tuple of everything that affects what is printed on screen."""
+        return (
+            self.state,
+            self.sort,
+            self.reverse,
+            self.focused,
+            self.side_focused,
+            self.row_offset,
+            self.x_scroll,
+            self.x_offset,
+            self.rows_version,
+            tuple(self.downloads_uris),
+            self.width,
+            self.height,
+        )
+
     def post_resize(self):
         logger.debug(f"Running post-resize function")
         logger.debug("Trying to re-apply pywal color theme")
@@ -595,211 +783,205 @@ class Interface:
         self.state_mapping[self.state]["process_keyboard_event"](event)
 
     def process_keyboard_event_main(self, event):
-        if event.key_code in Keys.MOVE_UP:
-            if self.focused > 0:
-                self.focused -= 1
-                logger.debug(f"Move focus up: {self.focused}")
-
-                if self.focused < self.row_offset:
-                    self.row_offset = self.focused
-                elif self.focused >= self.row_offset + (self.height - 1):
-                    # happens when shrinking height
-                    self.row_offset = self.focused + 1 - (self.height - 1)
-                self.follow = None
-                self.refresh = True
-
-        elif event.key_code in Keys.MOVE_DOWN:
-            if self.focused < len(self.rows) - 1:
-                self.focused += 1
-                logger.debug(f"Move focus down: {self.focused}")
-                if self.focused - self.row_offset >= (self.height - 1):
-                    self.row_offset = self.focused + 1 - (self.height - 1)
-                self.follow = None
-                self.refresh = True
-
-        elif event.key_code in Keys.MOVE_LEFT:
-            if self.x_scroll > 0:
-                self.x_scroll = max(0, self.x_scroll - 5)
-                self.refresh = True
-
-        elif event.key_code in Keys.MOVE_RIGHT:
-            self.x_scroll += 5
-            self.refresh = True
+        handler = self._main_dispatch.get(event.key_code)
+        if handler:
+            handler()
 
-        elif event.key_code in Keys.HELP:
-            self.state = self.State.HELP
-            self.refresh = True
-
-        elif event.key_code in Keys.SETUP:
-            pass  # TODO
-
-        elif event.key_code in Keys.TOGGLE_RESUME_PAUSE:
-            download = self.data[self.focused]
-            if download.is_active or download.is_waiting:
-                logger.debug(f"Pausing download {download.gid}")
-                download.pause()
-            elif download.is_paused:
-                logger.debug(f"Resuming download {download.gid}")
-                download.resume()
-
-        elif event.key_code in Keys.PRIORITY_UP:
-            download = self.data[self.focused]
-            if not download.is_active:
-                download.move_up()
-                self.follow = download
-
-        elif event.key_code in Keys.PRIORITY_DOWN:
-            download = self.data[self.focused]
-            if not download.is_active:
-                download.move_down()
-                self.follow = download
-
-        elif event.key_code in Keys.REVERSE_SORT:
-            self.reverse = not self.reverse
-            self.refresh = True
+    def _on_move_up(self):
+        self._apply_move(-1)
 
-        elif event.key_code in Keys.NEXT_SORT:
-            if self.sort < len(self.columns) - 1:
-                self.sort += 1
-                self.refresh = True
+    def _on_move_down(self):
+        self._apply_move(1)
 
-        elif event.key_code in Keys.PREVIOUS_SORT:
-            if self.sort > 0:
-                self.sort -= 1
-                self.refresh = True
+    def _move_step(self, event):
+        """Return -1 or 1 if the event moves the focus up or down in the main state, 0 otherwise."""
+        if self.state == self.State.MAIN and isinstance(event, KeyboardEvent):
+            return self._main_moves.get(event.key_code, 0)
+        return 0
 
-        elif event.key_code in Keys.SELECT_SORT:
-            self.state = self.State.SELECT_SORT
-            self.side_focused = self.sort
-            self.x_offset = self.width_select_sort() + 1
-            self.refresh = True
+    def _apply_move(self, delta):
+        """
+        Move the focus up (negative delta) or down (positive delta) by several rows at once.
 
-        elif event.key_code in Keys.REMOVE_ASK:
-            logger.debug("Triggered removal")
-            logger.debug(f"self.focused = {self.focused}")
-            logger.debug(f"len(self.data) = {len(self.data)}")
-            if self.follow_focused():
-                self.state = self.State.REMOVE_ASK
-                self.x_offset = self.width_remove_ask() + 1
-                if self.last_remove_choice is not None:
-                    self.side_focused = self.last_remove_choice
-                self.refresh = True
-            else:
-                logger.debug("Could not focus download")
+        Arguments:
+            delta (int): The number of rows to move the focus by.
+        """
+        if delta < 0:
+            focused = max(self.focused + delta, 0)
+        else:
+            focused = min(self.focused + delta, max(self.focused, len(self.rows) - 1))
+        if focused == self.focused:
+            return
+
+        self.focused = focused
+        logger.debug(f"Move focus by {delta}: {self.focused}")
+
+        if self.focused < self.row_offset:
+            self.row_offset = self.focused
+        elif self.focused >= self.row_offset + (self.height - 1):
+            # also happens when shrinking height
+            self.row_offset = self.focused + 1 - (self.height - 1)
+        self.follow = None
+        self.refresh = True
 
-        elif event.key_code in Keys.TOGGLE_EXPAND_COLLAPSE:
-            pass  # TODO
+    def _on_move_left(self):
+        if self.x_scroll > 0:
+            self.x_scroll = max(0, self.x_scroll - 5)
+            self.refresh = True
 
-        elif event.key_code in Keys.TOGGLE_EXPAND_COLLAPSE_ALL:
-            pass  # TODO
+    def _on_move_right(self):
+        self.x_scroll += 5
+        self.refresh = True
 
-        elif event.key_code in Keys.AUTOCLEAR:
-            self.api.purge()
+    def _on_help(self):
+        self.state = self.State.HELP
+        self.refresh = True
 
-        elif event.key_code in Keys.FOLLOW_ROW:
-            self.follow_focused()
+    def _on_toggle_resume_pause(self):
+        download = self.data[self.focused]
+        if download.is_active or download.is_waiting:
+            logger.debug(f"Pausing download {download.gid}")
+            download.pause()
+        elif download.is_paused:
+            logger.debug(f"Resuming download {download.gid}")
+            download.resume()
+
+    def _on_priority_up(self):
+        download = self.data[self.focused]
+        if not download.is_active:
+            download.move_up()
+            self.follow = download
+
+    def _on_priority_down(self):
+        download = self.data[self.focused]
+        if not download.is_active:
+            download.move_down()
+            self.follow = download
+
+    def _on_reverse_sort(self):
+        self.reverse = not self.reverse
+        self.refresh = True
 
-        elif event.key_code in Keys.SEARCH:
-            pass  # TODO
+    def _on_next_sort(self):
+        if self.sort < len(self.columns) - 1:
+            self.sort += 1
+            self.refresh = True
 
-        elif event.key_code in Keys.FILTER:
-            pass  # TODO
+    def _on_previous_sort(self):
+        if self.sort > 0:
+            self.sort -= 1
+            self.refresh = True
 
-        elif event.key_code in Keys.TOGGLE_SELECT:
-            pass  # TODO
+    def _on_select_sort(self):
+        self.state = self.State.SELECT_SORT
+        self.side_focused = self.sort
+        self.x_offset = self.width_select_sort() + 1
+        self.refresh = True
 
-        elif event.key_code in Keys.UN_SELECT_ALL:
-            pass  # TODO
+    def _on_remove_ask(self):
+        logger.debug("Triggered removal")
+        logger.debug(f"self.focused = {self.focused}")
+        logger.debug(f"len(self.data) = {len(self.data)}")
+        if self.follow_focused():
+            self.state = self.State.REMOVE_ASK
+            self.x_offset = self.width_remove_ask() + 1
+            if self.last_remove_choice is not None:
+                self.side_focused = self.last_remove_choice
+            self.refresh = True
+        else:
+            logger.debug("Could not focus download")
 
-        elif event.key_code in Keys.MOVE_HOME:
-            if self.focused > 0:
-                self.focused = 0
-                logger.debug(f"Move focus home: {self.focused}")
+    def _on_autoclear(self):
+        self.api.purge()
 
-                if self.focused < self.row_offset:
-                    self.row_offset = self.focused
-                elif self.focused >= self.row_offset + (self.height - 1):
-                    # happens when shrinking height
-                    self.row_offset = self.focused + 1 - (self.height - 1)
-                self.follow = None
-                self.refresh = True
+    def _on_follow_row(self):
+        self.follow_focused()
 
-        elif event.key_code in Keys.MOVE_END:
-            if self.focused < len(self.rows) - 1:
-                self.focused = len(self.rows) - 1
-                logger.debug(f"Move focus end: {self.focused}")
+    def _on_move_home(self):
+        if self.focused > 0:
+            self.focused = 0
+            logger.debug(f"Move focus home: {self.focused}")
 
-                if self.focused - self.row_offset >= (self.height - 1):
-                    self.row_offset = self.focused + 1 - (self.height - 1)
-                self.follow = None
-                self.refresh = True
+            if self.focused < self.row_offset:
+                self.row_offset = self.focused
+            elif self.focused >= self.row_offset + (self.height - 1):
+                # happens when shrinking height
+                self.row_offset = self.focused + 1 - (self.height - 1)
+            self.follow = None
+            self.refresh = True
 
-        elif event.key_code in Keys.MOVE_UP_STEP:
-            if self.focused > 0:
-                self.focused -= len(self.rows) // 5
+    def _on_move_end(self):
+        last = len(self.rows) - 1
+        if self.focused < last:
+            self.focused = last
+            logger.debug(f"Move focus end: {self.focused}")
 
-                if self.focused < 0:
-                    self.focused = 0
-                logger.debug(f"Move focus up (step): {self.focused}")
+            if self.focused - self.row_offset >= (self.height - 1):
+                self.row_offset = self.focused + 1 - (self.height - 1)
+            self.follow = None
+            self.refresh = True
 
-                if self.focused < self.row_offset:
-                    self.row_offset = self.focused
-                elif self.focused >= self.row_offset + (self.height - 1):
-                    # happens when shrinking height
-                    self.row_offset = self.focused + 1 - (self.height - 1)
+    def _on_move_up_step(self):
+        if self.focused > 0:
+            self.focused = max(self.focused - len(self.rows) // 5, 0)
+            logger.debug(f"Move focus up (step): {self.focused}")
 
-                self.follow = None
-                self.refresh = True
+            if self.focused < self.row_offset:
+                self.row_offset = self.focused
+            elif self.focused >= self.row_offset + (self.height - 1):
+                # happens when shrinking height
+                self.row_offset = self.focused + 1 - (self.height - 1)
 
-        elif event.key_code in Keys.MOVE_DOWN_STEP:
-            if self.focused < len(self.rows) - 1:
-                self.focused += len(self.rows) // 5
+            self.follow = None
+            self.refresh = True
 
-                if self.focused > len(self.rows) - 1:
-                    self.focused = len(self.rows) - 1
-                logger.debug(f"Move focus down (step): {self.focused}")
+    def _on_move_down_step(self):
+        n_rows = len(self.rows)
+        if self.focused < n_rows - 1:
+            self.focused = min(self.focused + n_rows // 5, n_rows - 1)
+            logger.debug(f"Move focus down (step): {self.focused}")
 
-                if self.focused - self.row_offset >= (self.height - 1):
-                    self.row_offset = self.focused + 1 - (self.height - 1)
-                self.follow = None
-                self.refresh = True
+            if self.focused - self.row_offset >= (self.height - 1):
+                self.row_offset = self.focused + 1 - (self.height - 1)
+            self.follow = None
+            self.refresh = True
 
-        elif event.key_code in Keys.TOGGLE_RESUME_PAUSE_ALL:
-            stats = self.api.get_stats()
-            if stats.num_active:
-                self.api.pause_all()
-            else:
-                self.api.resume_all()
+    def _on_toggle_resume_pause_all(self):
+        stats = self.api.get_stats()
+        if stats.num_active:
+            self.api.pause_all()
+        else:
+            self.api.resume_all()
 
-        elif event.key_code in Keys.RETRY:
-            download = self.data[self.focused]
-            self.api.retry_downloads([download])
+    def _on_retry(self):
+        download = self.data[self.focused]
+        self.api.retry_downloads([download])
 
-        elif event.key_code in Keys.RETRY_ALL:
-            downloads = self.data[:]
-            self.api.retry_downloads(downloads)
+    def _on_retry_all(self):
+        downloads = self.data[:]
+        self.api.retry_downloads(downloads)
 
-        elif event.key_code in Keys.ADD_DOWNLOADS:
-            self.state = self.State.ADD_DOWNLOADS
-            self.refresh = True
-            self.side_focused = 0
-            self.x_offset = self.width
+    def _on_add_downloads(self):
+        self.state = self.State.ADD_DOWNLOADS
+        self.refresh = True
+        self.side_focused = 0
+        self.x_offset = self.width
 
-            # build set of copied lines
-            copied_lines = set()
-            for line in pyperclip.paste().split("\n") + pyperclip.paste(primary=True).split("\n"):
-                copied_lines.add(line.strip())
-            try:
-                copied_lines.remove("")
-            except KeyError:
-                pass
+        # build set of copied lines
+        copied_lines = set()
+        for line in pyperclip.paste().split("\n") + pyperclip.paste(primary=True).split("\n"):
+            copied_lines.add(line.strip())
+        try:
+            copied_lines.remove("")
+        except KeyError:
+            pass
 
-            # add lines to download uris
-            if copied_lines:
-                self.downloads_uris = list(sorted(copied_lines))
+        # add lines to download uris
+        if copied_lines:
+            self.downloads_uris = list(sorted(copied_lines))
 
-        elif event.key_code in Keys.QUIT:
-            raise Exit()
+    def _on_quit(self):
+        raise Exit()
 
     def process_keyboard_event_help(self, event):
         self.state = self.State.MAIN
@@ -809,100 +991,112 @@ class Interface:
         pass
 
     def process_keyboard_event_remove_ask(self, event):
-        if event.key_code in Keys.CANCEL:
-            logger.debug("Canceling removal")
-            self.state = self.State.MAIN
-            self.x_offset = 0
-            self.refresh = True
+        handler = self._remove_ask_dispatch.get(event.key_code)
+        if handler:
+            handler()
 
-        elif event.key_code in Keys.ENTER:
-            logger.debug("Validate removal")
-            if self.follow:
-                self.remove_ask_rows[self.side_focused][1](self.follow)
-                self.follow = None
-            else:
-                logger.debug("No download was targeted, not removing")
-            self.last_remove_choice = self.side_focused
-            self.state = self.State.MAIN
-            self.x_offset = 0
+    def _on_remove_ask_cancel(self):
+        logger.debug("Canceling removal")
+        self.state = self.State.MAIN
+        self.x_offset = 0
+        self.refresh = True
 
-            # force complete refresh
-            self.frame = 0
+    def _on_remove_ask_enter(self):
+        logger.debug("Validate removal")
+        if self.follow:
+            self.remove_ask_rows[self.side_focused][1](self.follow)
+            self.follow = None
+        else:
+            logger.debug("No download was targeted, not removing")
+        self.last_remove_choice = self.side_focused
+        self.state = self.State.MAIN
+        self.x_offset = 0
 
-        elif event.key_code in Keys.MOVE_UP:
-            if self.side_focused > 0:
-                self.side_focused -= 1
-                logger.debug(f"Moving side focus up: {self.side_focused}")
-                self.refresh = True
+        # force complete refresh
+        self.next_update = 0
 
-        elif event.key_code in Keys.MOVE_DOWN:
-            if self.side_focused < len(self.remove_ask_rows) - 1:
-                self.side_focused += 1
-                logger.debug(f"Moving side focus down: {self.side_focused}")
-                self.refresh = True
+    def _on_remove_ask_move_up(self):
+        if self.side_focused > 0:
+            self.side_focused -= 1
+            logger.debug(f"Moving side focus up: {self.side_focused}")
+            self.refresh = True
+
+    def _on_remove_ask_move_down(self):
+        if self.side_focused < len(self.remove_ask_rows) - 1:
+            self.side_focused += 1
+            logger.debug(f"Moving side focus down: {self.side_focused}")
+            self.refresh = True
 
     def process_keyboard_event_select_sort(self, event):
-        if event.key_code in Keys.CANCEL:
-            self.state = self.State.MAIN
-            self.x_offset = 0
+        handler = self._select_sort_dispatch.get(event.key_code)
+        if handler:
+            handler()
+
+    def _on_select_sort_cancel(self):
+        self.state = self.State.MAIN
+        self.x_offset = 0
+        self.refresh = True
+
+    def _on_select_sort_enter(self):
+        self.sort = self.side_focused
+        self.state = self.State.MAIN
+        self.x_offset = 0
+        self.refresh = True
+
+    def _on_select_sort_move_up(self):
+        if self.side_focused > 0:
+            self.side_focused -= 1
             self.refresh = True
 
-        elif event.key_code in Keys.ENTER:
-            self.sort = self.side_focused
-            self.state = self.State.MAIN
-            self.x_offset = 0
+    def _on_select_sort_move_down(self):
+        if self.side_focused < len(self.select_sort_rows) - 1:
+            self.side_focused += 1
             self.refresh = True
 
-        elif event.key_code in Keys.MOVE_UP:
-            if self.side_focused > 0:
-                self.side_focused -= 1
-                self.refresh = True
+    def process_keyboard_event_add_downloads(self, event):
+        handler = self._add_downloads_dispatch.get(event.key_code)
+        if handler:
+            handler()
 
-        elif event.key_code in Keys.MOVE_DOWN:
-            if self.side_focused < len(self.select_sort_rows) - 1:
-                self.side_focused += 1
-                self.refresh = True
+    def _on_add_downloads_cancel(self):
+        self.state = self.State.MAIN
+        self.x_offset = 0
+        self.refresh = True
 
-    def process_keyboard_event_add_downloads(self, event):
-        if event.key_code in Keys.CANCEL:
-            self.state = self.State.MAIN
-            self.x_offset = 0
+    def _on_add_downloads_move_up(self):
+        if self.side_focused > 0:
+            self.side_focused -= 1
+
+            if self.side_focused < self.row_offset:
+                self.row_offset = self.side_focused
+            elif self.side_focused >= self.row_offset + (self.height - 1):
+                # happens when shrinking height
+                self.row_offset = self.side_focused + 1 - (self.height - 1)
+            self.follow = None
             self.refresh = True
 
-        elif event.key_code in Keys.MOVE_UP:
-            if self.side_focused > 0:
-                self.side_focused -= 1
+    def _on_add_downloads_move_down(self):
+        if self.side_focused < len(self.downloads_uris) - 1:
+            self.side_focused += 1
+            if self.side_focused - self.row_offset >= (self.height - 1):
+                self.row_offset = self.side_focused + 1 - (self.height - 1)
+            self.follow = None
+            self.refresh = True
 
-                if self.side_focused < self.row_offset:
-                    self.row_offset = self.side_focused
-                elif self.side_focused >= self.row_offset + (self.height - 1):
-                    # happens when shrinking height
-                    self.row_offset = self.side_focused + 1 - (self.height - 1)
-                self.follow = None
-                self.refresh = True
-
-        elif event.key_code in Keys.MOVE_DOWN:
-            if self.side_focused < len(self.downloads_uris) - 1:
-                self.side_focused += 1
-                if self.side_focused - self.row_offset >= (self.height - 1):
-                    self.row_offset = self.side_focused + 1 - (self.height - 1)
-                self.follow = None
-                self.refresh = True
-
-        elif event.key_code in Keys.ENTER:
-            if self.api.add(self.downloads_uris[self.side_focused]):
-                self.downloads_uris.pop(self.side_focused)
-                if 0 < self.side_focused > len(self.downloads_uris) - 1:
-                    self.side_focused -= 1
-                self.refresh = True
-
-        elif event.key_code in Keys.ADD_DOWNLOADS:
-            for uri in self.downloads_uris:
-                self.api.add(uri)
-
-            self.downloads_uris.clear()
+    def _on_add_downloads_enter(self):
+        if self.api.add(self.downloads_uris[self.side_focused]):
+            self.downloads_uris.pop(self.side_focused)
+            if 0 < self.side_focused > len(self.downloads_uris) - 1:
+                self.side_focused -= 1
             self.refresh = True
 
+    def _on_add_downloads_all(self):
+        for uri in self.downloads_uris:
+            self.api.add(uri)
+
+        self.downloads_uris.clear()
+        self.refresh = True
+
     def process_mouse_event(self, event):
         self.state_mapping[self.state]["process_mouse_event"](event)
 
@@ -954,7 +1148,7 @@ class Interface:
         header_string = f"{self.downloads_uris_header:<{padding}}"
         len_header = len(header_string)
         self.screen.print_at(header_string, 0, y, *self.palettes["side_column_header"])
-        self.screen.print_at(" ", len_header, y, *self.palettes["default"])
+        self.screen.print_at(" ", len_header, y, *DEFAULT_PALETTE)
         y += 1
         self.screen.print_at(" " * self.width, 0, y, *self.palettes["ui"])
         separator = "..."
@@ -972,10 +1166,9 @@ class Interface:
                 uri = f"{uri}"
 
             self.screen.print_at(uri, 0, y, *palette)
-            self.screen.print_at(" ", len(uri), y, *self.palettes["default"])
+            self.screen.print_at(" ", len(uri), y, *DEFAULT_PALETTE)
 
-        for i in range(1, self.height - y):
-            self.screen.print_at(" " * (padding + 1), 0, y + i, *self.palettes["ui"])
+        self.blank_lines(0, y + 1, padding + 1)
 
     def print_help(self):
         version = get_version()
@@ -990,37 +1183,37 @@ class Interface:
             self.screen.print_at(f"{line:<{self.width}}", 0, y, *self.palettes["bright_help"])
             y += 1
 
-        for keys, text in [
-            (Keys.HELP, " show this help screen"),
-            (Keys.MOVE_UP, " scroll downloads list"),
-            (Keys.MOVE_UP_STEP, " scroll downloads list (steps)"),
-            (Keys.MOVE_DOWN, " scroll downloads list"),
-            (Keys.MOVE_DOWN_STEP, " scroll downloads list (steps)"),
-            # not implemented: (Keys.SETUP, " setup"),
-            (Keys.TOGGLE_RESUME_PAUSE, " toggle pause/resume"),
-            (Keys.PRIORITY_UP, " priority up (-)"),
-            (Keys.PRIORITY_DOWN, " priority down (+)"),
-            (Keys.REVERSE_SORT, " invert sort order"),
-            (Keys.NEXT_SORT, " sort next column"),
-            (Keys.PREVIOUS_SORT, " sort previous column"),
-            (Keys.SELECT_SORT, " select sort column"),
-            (Keys.REMOVE_ASK, " remove download"),
-            # not implemented: (Keys.TOGGLE_EXPAND_COLLAPSE, " toggle expand/collapse"),
-            # not implemented: (Keys.TOGGLE_EXPAND_COLLAPSE_ALL, " toggle expand/collapse all"),
-            (Keys.AUTOCLEAR, " autopurge downloads"),
-            (Keys.FOLLOW_ROW, " cursor follows download"),
-            # not implemented: (Keys.SEARCH, " name search"),
-            # not implemented: (Keys.FILTER, " name filtering"),
-            # not implemented: (Keys.TOGGLE_SELECT, " toggle select download"),
-            # not implemented: (Keys.UN_SELECT_ALL, " unselect all downloads"),
-            (Keys.MOVE_HOME, " move focus to first download"),
-            (Keys.MOVE_END, " move focus to last download"),
-            (Keys.RETRY, " retry failed download"),
-            (Keys.RETRY_ALL, " retry all failed download"),
-            (Keys.ADD_DOWNLOADS, " add downloads from clipboard"),
-            (Keys.QUIT, " quit"),
+        for names, text in [
+            (Keys.HELP_NAMES, " show this help screen"),
+            (Keys.MOVE_UP_NAMES, " scroll downloads list"),
+            (Keys.MOVE_UP_STEP_NAMES, " scroll downloads list (steps)"),
+            (Keys.MOVE_DOWN_NAMES, " scroll downloads list"),
+            (Keys.MOVE_DOWN_STEP_NAMES, " scroll downloads list (steps)"),
+            # not implemented: (Keys.SETUP_NAMES, " setup"),
+            (Keys.TOGGLE_RESUME_PAUSE_NAMES, " toggle pause/resume"),
+            (Keys.PRIORITY_UP_NAMES, " priority up (-)"),
+            (Keys.PRIORITY_DOWN_NAMES, " priority down (+)"),
+            (Keys.REVERSE_SORT_NAMES, " invert sort order"),
+            (Keys.NEXT_SORT_NAMES, " sort next column"),
+            (Keys.PREVIOUS_SORT_NAMES, " sort previous column"),
+            (Keys.SELECT_SORT_NAMES, " select sort column"),
+            (Keys.REMOVE_ASK_NAMES, " remove download"),
+            # not implemented: (Keys.TOGGLE_EXPAND_COLLAPSE_NAMES, " toggle expand/collapse"),
+            # not implemented: (Keys.TOGGLE_EXPAND_COLLAPSE_ALL_NAMES, " toggle expand/collapse all"),
+            (Keys.AUTOCLEAR_NAMES, " autopurge downloads"),
+            (Keys.FOLLOW_ROW_NAMES, " cursor follows download"),
+            # not implemented: (Keys.SEARCH_NAMES, " name search"),
+            # not implemented: (Keys.FILTER_NAMES, " name filtering"),
+            # not implemented: (Keys.TOGGLE_SELECT_NAMES, " toggle select download"),
+            # not implemented: (Keys.UN_SELECT_ALL_NAMES, " unselect all downloads"),
+            (Keys.MOVE_HOME_NAMES, " move focus to first download"),
+            (Keys.MOVE_END_NAMES, " move focus to last download"),
+            (Keys.RETRY_NAMES, " retry failed download"),
+            (Keys.RETRY_ALL_NAMES, " retry all failed download"),
+            (Keys.ADD_DOWNLOADS_NAMES, " add downloads from clipboard"),
+            (Keys.QUIT_NAMES, " quit"),
         ]:
-            self.print_keys(keys, text, y)
+            self.print_keys(names, text, y)
             y += 1
 
         self.screen.print_at(" " * self.width, 0, y, *self.palettes["ui"])
@@ -1028,17 +1221,16 @@ class Interface:
         self.screen.print_at(f"{'Press any key to return.':<{self.width}}", 0, y, *self.palettes["bright_help"])
         y += 1
 
-        for i in range(self.height - y):
-            self.screen.print_at(" " * self.width, 0, y + i, *self.palettes["ui"])
+        self.blank_lines(0, y, self.width)
 
-    def print_keys(self, keys, text, y):
-        self.print_keys_text(" ".join(Keys.names(keys)) + ":", text, y)
+    def print_keys(self, names, text, y):
+        self.print_keys_text(" ".join(names) + ":", text, y)
 
     def print_keys_text(self, keys_text, text, y):
         length = 8
         padding = self.width - length
         self.screen.print_at(f"{keys_text:>{length}}", 0, y, *self.palettes["bright_help"])
-        self.screen.print_at(f"{text:<{padding}}", length, y, *self.palettes["default"])
+        self.screen.print_at(f"{text:<{padding}}", length, y, *DEFAULT_PALETTE)
 
     def print_remove_ask_column(self):
         y = self.y_offset
@@ -1046,7 +1238,7 @@ class Interface:
         header_string = f"{self.remove_ask_header:<{padding}}"
         len_header = len(header_string)
         self.screen.print_at(header_string, 0, y, *self.palettes["side_column_header"])
-        self.screen.print_at(" ", len_header, y, *self.palettes["default"])
+        self.screen.print_at(" ", len_header, y, *DEFAULT_PALETTE)
         for i, row in enumerate(self.remove_ask_rows):
             y += 1
             palette = (
@@ -1055,10 +1247,9 @@ class Interface:
             row_string = f"{row[0]:<{padding}}"
             len_row = len(row_string)
             self.screen.print_at(row_string, 0, y, *palette)
-            self.screen.print_at(" ", len_row, y, *self.palettes["default"])
+            self.screen.print_at(" ", len_row, y, *DEFAULT_PALETTE)
 
-        for i in range(1, self.height - y):
-            self.screen.print_at(" " * (padding + 1), 0, y + i, *self.palettes["ui"])
+        self.blank_lines(0, y + 1, padding + 1)
 
     def print_select_sort_column(self):
         y = self.y_offset
@@ -1066,7 +1257,7 @@ class Interface:
         header_string = f"{self.select_sort_header:<{padding}}"
         len_header = len(header_string)
         self.screen.print_at(header_string, 0, y, *self.palettes["side_column_header"])
-        self.screen.print_at(" ", len_header, y, *self.palettes["default"])
+        self.screen.print_at(" ", len_header, y, *DEFAULT_PALETTE)
         for i, row in enumerate(self.select_sort_rows):
             y += 1
             palette = (
@@ -1075,110 +1266,312 @@ class Interface:
             row_string = f"{row:<{padding}}"
             len_row = len(row_string)
             self.screen.print_at(row_string, 0, y, *palette)
-            self.screen.print_at(" ", len_row, y, *self.palettes["default"])
+            self.screen.print_at(" ", len_row, y, *DEFAULT_PALETTE)
 
-        for i in range(1, self.height - y):
-            self.screen.print_at(" " * (padding + 1), 0, y + i, *self.palettes["ui"])
+        self.blank_lines(0, y + 1, padding + 1)
 
     def print_table(self):
         self.print_headers()
         self.print_rows()
 
-    def print_headers(self):
-        """Print the headers (columns names)."""
-        self.scroller.set_scroll(self.x_scroll)
-        x, y, c = self.x_offset, self.y_offset, 0
+    def print_line(self, runs, x, y):
+        """
+        Print runs of text with the scroller, unless the exact same line was already printed there.
 
-        for column_name in self.columns_order:
-            column = self.columns[column_name]
-            palette = self.palettes["focused_header"] if c == self.sort else self.palettes["header"]
+        Arguments:
+            runs (list): A list of (text, palette) tuples, printed one after the other.
+            x (int): X axis position / column.
+            y (int): Y axis position / row.
+        """
+        line = (x, self.scroller.scroll, runs)
+        if self.shadow.get(y) == line:
+            return
+        for text, palette in runs:
+            x += self.scroller.print_at(text, x, y, palette)
+        self.shadow[y] = line
+
+    def blank_lines(self, x, y, width):
+        """
+        Blank the lines from `y` to the bottom of the screen, skipping the ones that are already blank.
+
+        The lines below the last start position used for the same area were blanked by the previous call,
+        and nothing else draws there until the layout changes, which resets this memory.
 
-            if column.padding == "100%":
-                header_string = f"{column.header}"
-                fill_up = " " * max(0, self.width - x - len(header_string))
-                written = self.scroller.print_at(header_string, x, y, palette)
-                self.scroller.print_at(fill_up, x + written, y, self.palettes["header"])
+        Arguments:
+            x (int): X axis position / column.
+            y (int): Y axis position / row of the first line to blank.
+            width (int): Width of the area to blank.
+        """
+        area = (x, width)
+        for line_y in range(y, self.blanked.get(area, self.height)):
+            self.screen.print_at(" " * width, x, line_y, *self.palettes["ui"])
+            self.shadow.pop(line_y, None)
+        self.blanked[area] = y
+
+    @staticmethod
+    def add_run(runs, text, palette):
+        """
+        Append text to a list of runs, merging it with the last run if they share the same palette.
 
+        Arguments:
+            runs (list): A list of (text, palette) tuples.
+            text (str): Text to append.
+            palette (list | tuple): A length-3 tuple or a list of length-3 tuples representing asciimatics palettes.
+        """
+        if runs and isinstance(palette, tuple) and palette == runs[-1][1]:
+            runs[-1] = (runs[-1][0] + text, palette)
+        else:
+            runs.append((text, palette))
+
+    def print_headers(self):
+        """Print the headers (columns names)."""
+        self.scroller.set_scroll(self.x_scroll)
+        runs = []
+        length = 0
+        header_palette = self.palettes["header"]
+        focused_header_palette = self.palettes["focused_header"]
+
+        for c, column in enumerate(self.ordered_columns):
+            palette = focused_header_palette if c == self.sort else header_palette
+
+            if column.fill:
+                # the scroller skips the first x_scroll characters of the line
+                x = self.x_offset + max(0, length - self.x_scroll)
+                fill_up = " " * max(0, self.width - x - len(column.formatted_header))
+                self.add_run(runs, column.formatted_header, palette)
+                self.add_run(runs, fill_up, header_palette)
             else:
-                header_string = f"{column.header:{column.padding}} "
-                written = self.scroller.print_at(header_string, x, y, palette)
+                self.add_run(runs, column.formatted_header, palette)
 
-            x += written
-            c += 1
+            length += len(column.formatted_header)
+
+        self.print_line(runs, self.x_offset, self.y_offset)
 
     def print_rows(self):
         """Print the rows."""
         y = self.y_offset + 1
-        for row in self.rows[self.row_offset : self.row_offset + self.height]:
-
-            self.scroller.set_scroll(self.x_scroll)
-            x = self.x_offset
-
-            for i, column_name in enumerate(self.columns_order):
-                column = self.columns[column_name]
-                padding = f"<{max(0, self.width - x)}" if column.padding == "100%" else column.padding
-
-                if self.focused == y - self.y_offset - 1 + self.row_offset:
-                    palette = self.palettes["focused_row"]
+        x_offset, x_scroll, width = self.x_offset, self.x_scroll, self.width
+        columns = self.ordered_columns
+        add_run = self.add_run
+        focused_palette = self.palettes["focused_row"]
+        focused_y = self.focused - self.row_offset + y
+        rows, data = self.rows, self.data
+        line_runs = self.line_runs
+        for index in range(self.row_offset, min(self.row_offset + self.height, len(rows))):
+            row = rows[index]
+            if row is None:
+                # the row was off screen during the last update
+                row = rows[index] = self.get_row(data[index])
+
+            self.scroller.set_scroll(x_scroll)
+            focused = y == focused_y
+
+            # the same row printed on the same line reuses its runs:
+            # they are not padded again, and the shadow buffer compares them by identity
+            cached = line_runs.get(y)
+            if cached is not None and cached[0] is row and cached[1] == focused:
+                self.print_line(cached[2], x_offset, y)
+                y += 1
+                continue
+
+            # consecutive cells sharing the same palette are printed at once
+            runs = []
+            length = 0
+            for column, (text, palette) in zip(columns, row):
+                if focused:
+                    palette = focused_palette
+
+                if column.fill:
+                    # the scroller skips the first x_scroll characters of the line
+                    x = x_offset + max(0, length - x_scroll)
+                    field_string = str(text).ljust(width - x) + " "
                 else:
-                    palette = column.get_palette(row[i])
-                    if isinstance(palette, str):
-                        palette = self.palettes[palette]
-
-                field_string = f"{row[i]:{padding}} "
-                written = self.scroller.print_at(field_string, x, y, palette)
-                x += written
+                    field_string = column.pad(text, column.pad_width) + " "
+                length += len(field_string)
+                add_run(runs, field_string, palette)
 
+            line_runs[y] = (row, focused, runs)
+            self.print_line(runs, x_offset, y)
             y += 1
 
-        for i in range(self.height - y):
-            self.screen.print_at(" " * self.width, self.x_offset, y + i, *self.palettes["ui"])
+        self.blank_lines(x_offset, y, width)
 
     def get_column_at_x(self, x):
-        """For an horizontal position X, return the column index."""
-        for i, bound in enumerate(self.bounds):
-            if bound[0] <= x <= bound[1]:
-                return i
-        raise ValueError("clicked outside of boundaries")
+        """For an horizontal position X, return the column index, clamping positions outside of the table."""
+        return self.column_at_x[min(max(x, 0), len(self.column_at_x) - 1)]
 
     def set_screen(self, screen):
-        """Set the screen object, its scroller wrapper, width, height, and columns bounds."""
+        """Set the screen object, its scroller wrapper, shadow buffer, width, height, and columns bounds."""
         self.screen = screen
         self.height, self.width = screen.dimensions
         self.scroller = HorizontalScroll(screen)
+        self.shadow = {}
+        self.shadow_layout = None
+        self.blanked = {}
+        self.line_runs = {}
+        self.last_paint_key = None
         self.bounds = []
-        for column_name in self.columns_order:
-            column = self.columns[column_name]
-            if column.padding == "100%":  # last column
-                self.bounds.append((self.bounds[-1][1] + 1, self.width))
-            else:
-                padding = int(column.padding.lstrip("<>=^"))
-                if not self.bounds:
-                    self.bounds = [(0, padding)]
-                else:
-                    self.bounds.append((self.bounds[-1][1] + 1, self.bounds[-1][1] + 1 + padding))
+        x = 0
+        for column in self.ordered_columns:
+            end = self.width if column.fill else x + column.pad_width
+            self.bounds.append((x, end))
+            x = end + 1
+        self.column_at_x = [index for index, (start, end) in enumerate(self.bounds) for _ in range(start, end + 1)]
 
     def get_data(self) -> list[Download]:
         """Return a list of objects."""
         return self.api.get_downloads()
 
+    def fetch_data(self) -> Future:
+        """
+        Fetch data in a background thread, so that a slow server does not freeze the interface.
+
+        The thread is a daemon: quitting the interface never waits for a pending request.
+
+        Returns:
+            A future holding the fetched data, or the raised exception.
+        """
+        future: Future = Future()
+
+        def fetch():
+            try:
+                future.set_result(self.get_data())
+            except Exception as error:
+                future.set_exception(error)
+
+        threading.Thread(target=fetch, daemon=True).start()
+        return future
+
     def update_data(self) -> None:
-        """Set the interface data and rows contents."""
+        """Set the interface data, fetched in the background if a fetch was started, and sort it."""
         try:
-            self.data = self.get_data()
+            if self.fetching is None:
+                self.data = self.get_data()
+            else:
+                fetching, self.fetching = self.fetching, None
+                self.data = fetching.result()
             self.sort_data()
         except requests.exceptions.Timeout:
             logger.debug("Request timeout")
 
     def sort_data(self) -> None:
         """Sort data according to interface state."""
-        sort_function = self.columns[self.columns_order[self.sort]].get_sort
-        self.data = sorted(self.data, key=sort_function, reverse=self.reverse)
+        sort_function = self.ordered_columns[self.sort].get_sort
+        keys = [sort_function(item) for item in self.data]
+        order = sorted(range(len(keys)), key=keys.__getitem__, reverse=self.reverse)
+        self.sort_keys = [keys[index] for index in order]
+        self.data = [self.data[index] for index in order]
+        self.data_index = {item.gid: index for index, item in enumerate(self.data)}
+
+    def reverse_data(self) -> None:
+        """
+        Reverse the sorted data and rows in place of sorting them again.
+
+        Items with equal sort keys keep their relative order, as if they were sorted in the other direction,
+        and the rows are reordered along with the data instead of being rebuilt.
+        """
+        keys = self.sort_keys
+        order = []
+        end = len(keys)
+        while end:
+            start = end - 1
+            while start and not (keys[start - 1] < keys[start] or keys[start] < keys[start - 1]):
+                start -= 1
+            order.extend(range(start, end))
+            end = start
+        self.sort_keys = [keys[index] for index in order]
+        self.data = [self.data[index] for index in order]
+        self.data_index = {item.gid: index for index, item in enumerate(self.data)}
+        self.rows = [self.rows[index] for index in order]
+        self.rows_version += 1
+        if self.follow:
+            self.focused = self.data_index[self.follow.gid]
+
+    def get_row_key(self, item) -> tuple:
+        """
+        Return a key identifying the contents of an item's row.
+
+        It must contain every value the columns depend on: items with the same key get the same row.
+        Subclasses changing the columns should override this method accordingly.
+
+        Arguments:
+            item (Download): The item to compute the key of.
+
+        Returns:
+            The row key.
+        """
+        return (
+            item.gid,
+            item.status,
+            item.completed_length,
+            item.total_length,
+            item.download_speed,
+            item.upload_speed,
+            item.name,
+        )
+
+    def build_row(self, item) -> tuple:
+        """
+        Build the row of an item.
+
+        Arguments:
+            item (Download): The item to build the row of.
+
+        Returns:
+            A (text, palette) tuple for each column.
+        """
+        get_palette = self.palettes.get
+        cells = []
+        for column in self.ordered_columns:
+            text = column.get_text(item)
+            palette = column.get_palette(text)
+            if isinstance(palette, str):
+                palette = get_palette(palette, DEFAULT_PALETTE)
+            cells.append((text, palette))
+        return tuple(cells)
+
+    def get_row(self, item) -> tuple:
+        """
+        Return the row of an item, reusing the cached one if its key did not change.
+
+        Arguments:
+            item (Download): The item to get the row of.
+
+        Returns:
+            A (text, palette) tuple for each column.
+        """
+        key = self.get_row_key(item)
+        cached = self.row_cache.get(item.gid)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        row = self.build_row(item)
+        self.row_cache[item.gid] = (key, row)
+        return row
 
     def update_rows(self) -> None:
-        """Update rows contents according to data and interface state."""
-        text_getters = [self.columns[c].get_text for c in self.columns_order]
-        n_columns = len(self.columns_order)
-        self.rows = [tuple(text_getters[i](item) for i in range(n_columns)) for item in self.data]
+        """
+        Update rows contents according to data and interface state.
+
+        Each cell is a (text, palette) tuple, so that texts and palettes are computed
+        once per update rather than each time the rows are printed.
+        Only the rows on screen are computed: rows of items that did not change since they were
+        last built are reused (see `get_row_key`), others are built again.
+        Off-screen rows are left to `None` and computed by `print_rows` when scrolled to.
+        """
+        data = self.data
+        # only keep the rows of the current items
+        row_cache = self.row_cache
+        self.row_cache = {gid: row_cache[gid] for gid in self.data_index if gid in row_cache}
+        rows = [None] * len(data)
+        if self.height is None:
+            visible = range(len(data))
+        else:
+            visible = range(self.row_offset, min(self.row_offset + self.height, len(data)))
+        get_row = self.get_row
+        for index in visible:
+            rows[index] = get_row(data[index])
+        if rows != self.rows:
+            self.rows = rows
+            self.rows_version += 1
         if self.follow:
-            self.focused = self.data.index(self.follow)
+            self.focused = self.data_index[self.follow.gid]
@@ -1,5 +1,6 @@
 """Tests for the `api` module."""
 
+import json
 import threading
 import time
 
@@ -40,6 +41,37 @@ def test_get_downloads_method(tmp_path, port):
         assert downloads[0].gid == "0000000000000001"
 
 
+def test_get_downloads_sends_one_multicall(monkeypatch):
+    client = Client(secret="secret")
+    payloads = []
+
+    def post(payload):
+        payloads.append(json.loads(payload))
+        return {"id": -1, "jsonrpc": "2.0", "result": [[[]], [[]], [[]]]}
+
+    monkeypatch.setattr(client, "post", post)
+    assert API(client).get_downloads() == []
+    assert len(payloads) == 1
+    assert payloads[0]["method"] == Client.MULTICALL
+    assert payloads[0]["params"] == [
+        [
+            {"methodName": Client.TELL_ACTIVE, "params": ["token:secret"]},
+            {"methodName": Client.TELL_WAITING, "params": ["token:secret", 0, 1000]},
+            {"methodName": Client.TELL_STOPPED, "params": ["token:secret", 0, 1000]},
+        ],
+    ]
+
+
+def test_get_downloads_raises_faults(monkeypatch):
+    client = Client()
+    fault = {"code": 1, "message": "Unauthorized"}
+    monkeypatch.setattr(client, "multicall2", lambda calls: [[[]], fault, [[]]])
+    with pytest.raises(ClientException) as error:
+        API(client).get_downloads()
+    assert error.value.code == 1
+    assert error.value.message == "Unauthorized"
+
+
 def test_get_global_options_method(tmp_path, port):
     with Aria2Server(tmp_path, port, config=CONFIGS_DIR / "max-5-dls.conf") as server:
         options = server.api.get_global_options()
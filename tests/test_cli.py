@@ -1,11 +1,11 @@
 """Tests for the `cli` module."""
 
+import sys
 import threading
 import time
 
 import pytest
 
-from aria2p.cli.commands import top
 from aria2p.cli.commands.add_magnet import add_magnets
 from aria2p.cli.commands.add_metalink import add_metalinks
 from aria2p.cli.commands.add_torrent import add_torrents
@@ -85,7 +85,7 @@ def test_parser_error_when_no_gid_and_no_all_option(capsys):
 
 
 def test_no_interface_deps_print_error(server, monkeypatch, capsys):
-    monkeypatch.setattr(top, "Interface", None)
+    monkeypatch.setitem(sys.modules, "aria2p.interface", None)
     main(["-p", str(server.port)])
     line = first_err_line(capsys)
     assert "aria2p[tui]" in line
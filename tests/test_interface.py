@@ -2,7 +2,9 @@
 
 import os
 import sys
+import threading
 import time
+from concurrent import futures
 from pathlib import Path
 
 import pyperclip
@@ -10,18 +12,18 @@ import pytest
 from asciimatics.event import KeyboardEvent, MouseEvent
 from asciimatics.screen import Screen
 
+from aria2p import Download
 from aria2p import interface as tui
 
 from . import TESTS_DATA_DIR
 from .conftest import Aria2Server
 
-tui.Interface.frames = 20  # reduce tests time
+tui.Interface.refresh_interval = 0.1  # reduce tests time
 
 
 class SpecialEvent:
     RESIZE = 1
-    PASS_N_FRAMES = 2
-    PASS_N_TICKS = 3
+    PASS_TIME = 2
     RAISE = 4
 
     def __init__(self, event_type, value=None):
@@ -31,10 +33,10 @@ class SpecialEvent:
 
 class Event:
     resize = SpecialEvent(SpecialEvent.RESIZE)
-    pass_frame = SpecialEvent(SpecialEvent.PASS_N_FRAMES, 1)
-    pass_tick = SpecialEvent(SpecialEvent.PASS_N_TICKS, 1)
-    pass_half_tick = SpecialEvent(SpecialEvent.PASS_N_FRAMES, tui.Interface.frames / 2)
-    pass_tick_and_a_half = SpecialEvent(SpecialEvent.PASS_N_FRAMES, tui.Interface.frames * 3 / 2)
+    pass_frame = SpecialEvent(SpecialEvent.PASS_TIME, 0)
+    pass_tick = SpecialEvent(SpecialEvent.PASS_TIME, tui.Interface.refresh_interval)
+    pass_half_tick = SpecialEvent(SpecialEvent.PASS_TIME, tui.Interface.refresh_interval / 2)
+    pass_tick_and_a_half = SpecialEvent(SpecialEvent.PASS_TIME, tui.Interface.refresh_interval * 3 / 2)
     up = KeyboardEvent(Screen.KEY_UP)
     down = KeyboardEvent(Screen.KEY_DOWN)
     left = KeyboardEvent(Screen.KEY_LEFT)
@@ -64,35 +66,35 @@ class Event:
     def exc(value):
         return SpecialEvent(SpecialEvent.RAISE, value)
 
-    @staticmethod
-    def pass_frames(value):
-        return SpecialEvent(SpecialEvent.PASS_N_FRAMES, value)
-
     @staticmethod
     def pass_ticks(value):
-        return SpecialEvent(SpecialEvent.PASS_N_TICKS, value)
+        return SpecialEvent(SpecialEvent.PASS_TIME, value * tui.Interface.refresh_interval)
 
 
-def get_interface(patcher, api=None, events=None, append_q=True):
+def get_interface(patcher, api=None, events=None, append_q=True, screen_class=None):
     if not events:
         events = []
 
     if append_q:
         events.append(KeyboardEvent(ord("q")))
 
+    interface = tui.Interface(api=api)
+
     class MockedManagedScreen:
         def __enter__(self):
-            return MockedScreen(events)
+            screen = (screen_class or MockedScreen)(events)
+            screen.interface = interface
+            return screen
 
         def __exit__(self, exc_type, exc_val, exc_tb):
             pass
 
     patcher.setattr(tui, "ManagedScreen", MockedManagedScreen)
-    return tui.Interface(api=api)
+    return interface
 
 
-def run_interface(patcher, api=None, events=None, append_q=True, **kwargs):
-    interface = get_interface(patcher, api, events, append_q)
+def run_interface(patcher, api=None, events=None, append_q=True, screen_class=None, **kwargs):
+    interface = get_interface(patcher, api, events, append_q, screen_class)
     for key, value in kwargs.items():
         setattr(interface, key, value)
     interface.run()
@@ -100,10 +102,14 @@ def run_interface(patcher, api=None, events=None, append_q=True, **kwargs):
 
 
 class MockedScreen:
+    interface = None
+    # hand over the next event only once a background fetch is applied, so that tests do not depend on timing
+    wait_fetches = True
+
     def __init__(self, events):
         self.events = events
         self._has_resized = False
-        self._pass_n_frames = 0
+        self._idle_until = 0
         self.print_at_calls = []
         self.paint_calls = []
         self.n_refresh = 0
@@ -121,9 +127,23 @@ class MockedScreen:
     def close(self):
         pass
 
+    def wait_for_input(self, timeout):
+        # no input is coming while time is passing
+        time.sleep(max(0, min(timeout, self._idle_until - time.monotonic())))
+
+    def idle(self):
+        if time.monotonic() < self._idle_until:
+            return True
+        # a refresh due while time was passing must be started before the next event
+        return self.interface is not None and self.interface.next_update <= self._idle_until
+
     def get_event(self):
-        if self._pass_n_frames > 0:
-            self._pass_n_frames -= 1
+        if self.idle():
+            return None
+        fetching = self.interface and self.interface.fetching
+        if self.wait_fetches and fetching is not None:
+            # the interface applies the fetched data once it stops processing events
+            futures.wait([fetching])
             return None
         event = self.events.pop(0)
         if isinstance(event, (KeyboardEvent, MouseEvent)):
@@ -131,12 +151,8 @@ class MockedScreen:
         elif isinstance(event, SpecialEvent):
             if event.type == SpecialEvent.RESIZE:
                 self._has_resized = True
-            elif event.type == SpecialEvent.PASS_N_FRAMES:
-                # we remove 1 because this event itself eats a frame
-                self._pass_n_frames = event.value - 1
-            elif event.type == SpecialEvent.PASS_N_TICKS:
-                # we remove 1 because this event itself eats a frame
-                self._pass_n_frames = (event.value * tui.Interface.frames) - 1
+            elif event.type == SpecialEvent.PASS_TIME:
+                self._idle_until = time.monotonic() + event.value
             elif event.type == SpecialEvent.RAISE:
                 raise event.value
         return None
@@ -153,6 +169,81 @@ class MockedScreen:
         self.n_refresh += 1
 
 
+class GridScreen(MockedScreen):
+    """A mocked screen keeping the characters and colours printed on it, to compare different paints."""
+
+    def __init__(self, events, height=30, width=80):
+        super().__init__(events)
+        self.height, self.width = height, width
+        self.grid = [[(" ", None)] * width for _ in range(height)]
+
+    @property
+    def dimensions(self):
+        return self.height, self.width
+
+    def print_at(self, text, x, y, colour=7, attr=0, bg=0, transparent=False):
+        self.put(text, x, y, [(colour, attr, bg)])
+
+    def paint(self, text, x, y, colour=7, attr=0, bg=0, transparent=False, colour_map=None):
+        self.put(text, x, y, colour_map or [(colour, attr, bg)])
+
+    def put(self, text, x, y, colours):
+        # like asciimatics, the last colour is used for the rest of the text
+        if 0 <= y < self.height:
+            for index, char in enumerate(text):
+                if 0 <= x + index < self.width:
+                    self.grid[y][x + index] = (char, tuple(colours[min(index, len(colours) - 1)]))
+
+
+def full_repaint(interface):
+    """Rebuild every row and paint the current state of the interface on a new, empty screen."""
+    screen = GridScreen([], *interface.screen.dimensions)
+    interface.set_screen(screen)
+    interface.rows = [interface.build_row(item) for item in interface.data]
+    for print_function in interface.state_mapping[interface.state]["print_functions"]:
+        print_function()
+    return screen.grid
+
+
+def download_struct(index, status="paused", completed_length=0, download_speed=0):
+    return {
+        "gid": f"{index:016x}",
+        "status": status,
+        "totalLength": "1000",
+        "completedLength": str(completed_length),
+        "downloadSpeed": str(download_speed),
+        "uploadSpeed": "0",
+        "dir": "/downloads",
+        "files": [
+            {
+                "index": "1",
+                "path": f"/downloads/file-{index}.iso",
+                "length": "1000",
+                "completedLength": str(completed_length),
+                "selected": "true",
+                "uris": [],
+            }
+        ],
+    }
+
+
+class FakeAPI:
+    """An API serving downloads built from structs, to run the interface without an aria2 server."""
+
+    def __init__(self, structs):
+        self.structs = structs
+        self.calls = 0
+
+    def get_downloads(self):
+        self.calls += 1
+        return [Download(self, struct) for struct in self.structs]
+
+    def remove(self, downloads, force=False, files=False):
+        gids = {download.gid for download in downloads}
+        self.structs = [struct for struct in self.structs if struct["gid"] not in gids]
+        return [True] * len(downloads)
+
+
 def test_run(monkeypatch):
     interface = run_interface(monkeypatch)
     assert interface.screen
@@ -166,10 +257,18 @@ def test_resize(server, monkeypatch):
     assert not interface.screen.has_resized()
 
 
-def test_frames_plus_n(server, monkeypatch):
-    n = 10
-    interface = run_interface(monkeypatch, server.api, events=[Event.pass_frames(tui.Interface.frames + n)])
-    assert interface.frame == n
+def test_update_every_refresh_interval(server, monkeypatch):
+    n_updates = 0
+    update_data = tui.Interface.update_data
+
+    def counting_update_data(self):
+        nonlocal n_updates
+        n_updates += 1
+        update_data(self)
+
+    monkeypatch.setattr(tui.Interface, "update_data", counting_update_data)
+    run_interface(monkeypatch, server.api, events=[Event.pass_ticks(3)])
+    assert n_updates >= 3
 
 
 def test_change_sort(server, monkeypatch):
@@ -409,18 +508,14 @@ def test_click_row(tmp_path, port, monkeypatch):
 
 
 def test_click_out_bounds(server, monkeypatch):
-    run_interface(
+    interface = run_interface(
         monkeypatch, server.api, events=[Event.pass_frame, MouseEvent(x=1000, y=0, buttons=MouseEvent.LEFT_CLICK)]
     )
+    # clicks past the right edge select the rightmost column
+    assert interface.sort == interface.column_at_x[-1]
     with open(Path("tests") / "logs" / "test_interface" / "test_click_out_bounds.log") as log_file:
         lines = log_file.readlines()
-    error_line = None
-    for line in lines:
-        if "ERROR" in line:
-            error_line = line
-            break
-    assert error_line
-    assert "clicked outside of boundaries" in error_line
+    assert not any("ERROR" in line for line in lines)
 
 
 @pytest.mark.skipif(
@@ -502,3 +597,230 @@ def test_add_downloads_torrents_and_metalinks(server, monkeypatch):
     pyperclip.copy("")
     pyperclip.copy("", primary=True)
     assert len(interface.data) == 2
+
+
+def test_first_events_act_on_loaded_data(monkeypatch):
+    api = FakeAPI([download_struct(1), download_struct(2)])
+    interface = run_interface(monkeypatch, api, events=[MouseEvent(x=10, y=2, buttons=MouseEvent.LEFT_CLICK)])
+    assert interface.focused == 1
+
+    interface = run_interface(monkeypatch, api, events=[Event.delete, Event.down, Event.enter, Event.delete, Event.esc])
+    assert interface.last_remove_choice == 1
+    assert interface.side_focused == 1
+
+
+def test_refresh_in_background(monkeypatch):
+    released = threading.Event()
+
+    class SlowAPI(FakeAPI):
+        def get_downloads(self):
+            if self.calls:
+                # only the first load is synchronous, the next ones must not block events
+                released.wait()
+                self.structs = [download_struct(1), download_struct(2), download_struct(3)]
+            return super().get_downloads()
+
+    fetching_during_move = []
+    apply_move = tui.Interface._apply_move
+
+    def recording_apply_move(self, delta):
+        fetching_during_move.append(self.fetching is not None and not self.fetching.done())
+        apply_move(self, delta)
+        released.set()
+        self.screen.wait_fetches = True
+
+    class NonWaitingScreen(MockedScreen):
+        wait_fetches = False
+
+    monkeypatch.setattr(tui.Interface, "_apply_move", recording_apply_move)
+    api = SlowAPI([download_struct(1), download_struct(2)])
+    # fetch again as soon as possible: the first fetch starts before the down key is processed
+    interface = run_interface(
+        monkeypatch,
+        api,
+        events=[Event.pass_frame, Event.down, Event.pass_frame],
+        screen_class=NonWaitingScreen,
+        refresh_interval=0,
+    )
+    assert fetching_during_move == [True]
+    assert interface.focused == 1
+    assert len(interface.data) == 3
+
+
+def test_column_pads_non_string_cells():
+    column = tui.Column("N", ">4", lambda item: 12, lambda item: 12, lambda item: "default")
+    assert column.pad(12, column.pad_width) == "  12"
+    column = tui.Column("N", "=5", lambda item: -12, lambda item: -12, lambda item: "default")
+    assert column.formatted_header == "    N "
+    assert column.pad(-12, column.pad_width) == "-  12"
+
+
+def test_scroll_into_rows_built_lazily(monkeypatch):
+    api = FakeAPI([download_struct(index) for index in range(1, 61)])
+    events = [Event.pass_frame] + [Event.down] * 45 + [Event.pass_frame]
+    interface = run_interface(monkeypatch, api, events=events, screen_class=GridScreen)
+    assert interface.focused == 45
+    # rows below the screen were never needed
+    assert interface.rows[-1] is None
+    assert interface.screen.grid == full_repaint(interface)
+
+    keys = []
+    get_row_key = tui.Interface.get_row_key
+    monkeypatch.setattr(tui.Interface, "get_row_key", lambda self, item: keys.append(item) or get_row_key(self, item))
+    interface.update_rows()
+    assert len(keys) == interface.height
+
+
+def test_reverse_sort_with_equal_keys(monkeypatch):
+    statuses = ["active", "paused", "waiting"]
+    api = FakeAPI([download_struct(index, status=statuses[index % 3]) for index in range(1, 13)])
+    interface = get_interface(monkeypatch, api)
+    interface.set_screen(GridScreen([]))
+    interface.sort = interface.columns_order.index("status")
+    interface.update_data()
+    interface.update_rows()
+    get_sort = interface.ordered_columns[interface.sort].get_sort
+
+    for _ in range(3):
+        interface.reverse = not interface.reverse
+        interface.reverse_data()
+        expected = sorted(api.get_downloads(), key=get_sort, reverse=interface.reverse)
+        assert [item.gid for item in interface.data] == [item.gid for item in expected]
+        assert interface.sort_keys == [get_sort(item) for item in interface.data]
+        assert interface.data_index == {item.gid: index for index, item in enumerate(interface.data)}
+        assert interface.rows == [interface.build_row(item) for item in interface.data]
+
+
+@pytest.mark.parametrize(
+    ("moves", "applied", "focused"),
+    [
+        ([Event.down] * 4, [4], 4),
+        ([Event.down] * 20, [20], 9),
+        ([Event.down] * 20 + [Event.up] * 3, [20, -3], 6),
+        ([Event.up] * 3 + [Event.down] * 2, [-3, 2], 2),
+        ([Event.down] * 4 + [Event.up] + [Event.down] * 2, [4, -1, 2], 5),
+    ],
+)
+def test_coalesce_bursts_of_moves(monkeypatch, moves, applied, focused):
+    api = FakeAPI([download_struct(index) for index in range(1, 11)])
+    deltas = []
+    apply_move = tui.Interface._apply_move
+
+    def recording_apply_move(self, delta):
+        deltas.append(delta)
+        apply_move(self, delta)
+
+    monkeypatch.setattr(tui.Interface, "_apply_move", recording_apply_move)
+    interface = run_interface(monkeypatch, api, events=[Event.pass_frame, *moves, Event.pass_frame])
+    assert deltas == applied
+    assert interface.focused == focused
+
+
+@pytest.mark.parametrize(
+    "events",
+    [
+        [Event.down, Event.down, Event.pass_frame, Event.up],
+        [Event.right, Event.pass_frame, Event.right, Event.pass_frame, Event.left],
+        [Event.f1, Event.pass_frame, Event.enter],
+        [Event.down, Event.resize, Event.pass_frame, Event.down],
+        [Event.hit(">"), Event.pass_frame, Event.hit("I"), Event.pass_tick_and_a_half],
+    ],
+)
+def test_incremental_repaint_matches_full_repaint(monkeypatch, events):
+    api = FakeAPI([download_struct(index, completed_length=index * 10) for index in range(1, 11)])
+    events = [Event.pass_frame, *events, Event.pass_frame]
+    interface = run_interface(monkeypatch, api, events=events, screen_class=GridScreen)
+    assert interface.screen.grid == full_repaint(interface)
+
+
+def test_repaint_after_rows_shrink(monkeypatch):
+    class ShrinkingAPI(FakeAPI):
+        def get_downloads(self):
+            if self.calls:
+                self.structs = self.structs[:3]
+            return super().get_downloads()
+
+    api = ShrinkingAPI([download_struct(index) for index in range(1, 11)])
+    interface = run_interface(monkeypatch, api, events=[Event.pass_ticks(2)], screen_class=GridScreen)
+    assert len(interface.data) == 3
+    assert interface.screen.grid == full_repaint(interface)
+
+    # removing a download also leaves a blank line at the bottom of the table
+    api = FakeAPI([download_struct(index) for index in range(1, 11)])
+    events = [Event.pass_frame, Event.delete, Event.enter, Event.pass_ticks(2)]
+    interface = run_interface(monkeypatch, api, events=events, screen_class=GridScreen)
+    assert len(interface.data) == 9
+    assert interface.screen.grid == full_repaint(interface)
+
+
+def test_rebuild_rows_of_changed_downloads(monkeypatch):
+    api = FakeAPI([download_struct(index) for index in range(1, 4)])
+    interface = get_interface(monkeypatch, api)
+    interface.set_screen(GridScreen([]))
+    interface.update_data()
+    interface.update_rows()
+    previous_rows = dict(zip(interface.data_index, interface.rows))
+
+    api.structs[1] = download_struct(2, status="active", completed_length=500, download_speed=100)
+    interface.update_data()
+    interface.update_rows()
+    rows = dict(zip(interface.data_index, interface.rows))
+    changed = api.structs[1]["gid"]
+    assert rows[changed] != previous_rows[changed]
+    assert rows[changed] == interface.build_row(interface.data[interface.data_index[changed]])
+    texts = [text for text, _ in rows[changed]]
+    assert "active" in texts
+    assert "50.00%" in texts
+    for gid, row in rows.items():
+        if gid != changed:
+            assert row is previous_rows[gid]
+
+
+def test_fetch_data_in_daemon_thread(monkeypatch):
+    interface = get_interface(monkeypatch, FakeAPI([download_struct(1)]))
+    threads = []
+
+    def get_data():
+        threads.append(threading.current_thread())
+        return []
+
+    monkeypatch.setattr(interface, "get_data", get_data)
+    assert interface.fetch_data().result() == []
+    # quitting the interface must not wait for a pending request
+    assert threads[0].daemon
+
+    monkeypatch.setattr(interface, "get_data", lambda: 1 / 0)
+    with pytest.raises(ZeroDivisionError):
+        interface.fetch_data().result()
+
+
+def test_autoclear_with_slow_server(monkeypatch):
+    class SlowAPI(FakeAPI):
+        def get_downloads(self):
+            if self.calls:
+                # the refresh is still running when the time passed in the events is over
+                time.sleep(tui.Interface.refresh_interval)
+            return super().get_downloads()
+
+        def purge(self):
+            self.structs = []
+            return True
+
+    api = SlowAPI([download_struct(1, status="complete", completed_length=1000)])
+    interface = run_interface(monkeypatch, api, events=[Event.pass_frame, Event.hit("c"), Event.pass_tick])
+    assert not interface.data
+
+
+def test_unchanged_lines_reuse_their_runs(monkeypatch):
+    api = FakeAPI([download_struct(index) for index in range(1, 4)])
+    interface = run_interface(monkeypatch, api, events=[Event.pass_frame, Event.down, Event.pass_frame])
+    runs = {y: line[2] for y, line in interface.line_runs.items()}
+    assert len(runs) == 3
+
+    interface.focused = 2
+    interface.print_rows()
+    for y, line_runs in runs.items():
+        # only the lines of the previously and newly focused rows changed
+        reused = interface.line_runs[y][2] is line_runs
+        assert reused == (y == interface.y_offset + 1)
+        assert interface.shadow[y][2] is interface.line_runs[y][2]